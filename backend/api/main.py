@@ -1,11 +1,18 @@
 """
 FastAPI main application for Artify events API
 """
-from fastapi import FastAPI, Query, HTTPException
+from fastapi import FastAPI, Query, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from typing import Optional, List
+from fastapi.responses import ORJSONResponse
+from typing import Optional, List, Callable, Any
 from datetime import datetime
+from contextlib import asynccontextmanager
+import functools
+import hashlib
+import orjson
 import sys
+import threading
+import time
 from pathlib import Path
 
 # Add backend to path
@@ -13,10 +20,21 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from core.db import EventsDB
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Close the database connections on shutdown, refreshing planner statistics"""
+    yield
+    db.close()
+
+
 app = FastAPI(
     title="Artify API",
     description="API for Paris cultural events aggregator",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
+    # orjson serializes the event payloads much faster than the stdlib encoder
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware
@@ -29,9 +47,61 @@ app.add_middleware(
 )
 
 # Initialize database
+# Endpoints that query it are plain `def` functions: FastAPI runs those in
+# its worker threadpool, so the blocking sqlite3 calls don't stall the
+# event loop, and EventsDB gives each worker thread its own connection.
 db = EventsDB()
 
 
+def ttl_cache(seconds: float) -> Callable:
+    """Cache a zero-argument function's result for the given number of seconds"""
+    def decorator(func: Callable[[], Any]) -> Callable[[], Any]:
+        lock = threading.Lock()
+        cached = {"expires": 0.0, "value": None}
+        
+        @functools.wraps(func)
+        def wrapper() -> Any:
+            with lock:
+                now = time.monotonic()
+                if now >= cached["expires"]:
+                    cached["value"] = func()
+                    cached["expires"] = now + seconds
+                return cached["value"]
+        
+        return wrapper
+    return decorator
+
+
+def etag_response(request: Request, payload: Any) -> Response:
+    """
+    Serialize payload once and answer with 304 if the client already has it
+    
+    Clients re-poll listings with identical filters; a matching
+    If-None-Match header skips sending the body again.
+    """
+    body = orjson.dumps(payload)
+    etag = f'W/"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "private, max-age=30"}
+    
+    # If-None-Match uses weak comparison (RFC 9110): W/"x" and "x" match,
+    # and "*" matches any current representation
+    opaque_tag = etag.removeprefix("W/")
+    for tag in request.headers.get("if-none-match", "").split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == opaque_tag:
+            return Response(status_code=304, headers=headers)
+    
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+# Categories and venues only change when the daily ingest runs, and the
+# statistics are aggregates over the whole table, so serve them from
+# short-lived caches rather than querying on every hit
+cached_categories = ttl_cache(300)(db.get_categories)
+cached_venues = ttl_cache(300)(db.get_venues)
+cached_statistics = ttl_cache(60)(db.get_statistics)
+
+
 @app.get("/")
 async def root():
     """Root endpoint"""
@@ -41,6 +111,7 @@ async def root():
         "endpoints": {
             "events": "/events",
             "event_detail": "/events/{id}",
+            "events_batch": "/events/batch?ids=id1,id2",
             "categories": "/categories",
             "venues": "/venues",
             "statistics": "/statistics"
@@ -49,7 +120,8 @@ async def root():
 
 
 @app.get("/events")
-async def get_events(
+def get_events(
+    request: Request,
     date_from: Optional[str] = Query(None, description="Start date filter (ISO 8601)"),
     date_to: Optional[str] = Query(None, description="End date filter (ISO 8601)"),
     category: Optional[str] = Query(None, description="Category filter"),
@@ -67,60 +139,68 @@ async def get_events(
             category=category,
             venue=venue,
             is_free=is_free,
-            limit=limit * 2 if search else limit,  # Get more for filtering
+            search=search,
+            limit=limit,
             offset=offset
         )
         
-        # Apply search filter if provided
-        if search:
-            search_lower = search.lower()
-            events = [
-                e for e in events
-                if (search_lower in e.get('title', '').lower() or
-                    search_lower in e.get('description', '').lower() or
-                    search_lower in e.get('location', '').lower() or
-                    search_lower in e.get('category', '').lower())
-            ]
-            # Limit after filtering
-            events = events[:limit]
-        
-        return {
+        return etag_response(request, {
             "count": len(events),
             "limit": limit,
             "offset": offset,
             "events": events
-        }
+        })
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/events/batch")
+def get_events_batch(
+    request: Request,
+    ids: str = Query(..., description="Comma-separated event IDs")
+):
+    """Get several events by ID in a single request"""
+    event_ids = list(dict.fromkeys(i.strip() for i in ids.split(",") if i.strip()))
+    if len(event_ids) > 500:
+        raise HTTPException(status_code=400, detail="At most 500 IDs per request")
+    
+    events = db.get_events_by_ids(event_ids)
+    return etag_response(request, {
+        "count": len(events),
+        "events": events
+    })
+
+
 @app.get("/events/{event_id}")
-async def get_event(event_id: str):
+def get_event(request: Request, event_id: str):
     """Get a single event by ID"""
     event = db.get_event(event_id)
     if not event:
         raise HTTPException(status_code=404, detail="Event not found")
-    return event
+    return etag_response(request, event)
 
 
 @app.get("/categories")
-async def get_categories():
+def get_categories(response: Response):
     """Get list of all event categories"""
-    categories = db.get_categories()
+    response.headers["Cache-Control"] = "public, max-age=300"
+    categories = cached_categories()
     return {"categories": categories}
 
 
 @app.get("/venues")
-async def get_venues():
+def get_venues(response: Response):
     """Get list of all venues"""
-    venues = db.get_venues()
+    response.headers["Cache-Control"] = "public, max-age=300"
+    venues = cached_venues()
     return {"venues": venues}
 
 
 @app.get("/statistics")
-async def get_statistics():
+def get_statistics(response: Response):
     """Get database statistics"""
-    stats = db.get_statistics()
+    response.headers["Cache-Control"] = "public, max-age=60"
+    stats = cached_statistics()
     return stats
 
 
@@ -1,25 +1,222 @@
 """
 Database module for Artify - SQLite database with event schema
 """
+import hashlib
 import sqlite3
-from datetime import datetime
-from typing import Dict, List, Optional, Any
+import threading
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Any, Tuple
 from pathlib import Path
 import json
 
 
+# Column order shared by _upsert_events_sql and _event_params
+_EVENT_COLUMNS = (
+    "id", "title", "description", "start_date", "end_date", "location", "address",
+    "category", "image_url", "source_url", "source_name",
+    "is_free", "price", "price_min", "price_max", "currency", "ticket_url",
+    "created_at", "updated_at",
+)
+
+# Columns overwritten when an incoming event matches a stored source_url;
+# id and created_at keep their original values
+_EVENT_UPDATE_COLUMNS = (
+    "title", "description", "start_date", "end_date",
+    "location", "address", "category", "image_url",
+    "is_free", "price", "price_min", "price_max",
+    "currency", "ticket_url", "updated_at",
+)
+
+# Bound parameters per multi-row upsert. The SQLite versions this module
+# needs (3.35+) allow 32766, but statements are kept small on purpose:
+# _upsert_events_sql caches one SQL string per row count, and chunks of a
+# few dozen rows already amortize the per-statement overhead
+_MAX_VARIABLES = 999
+
+# Rows per multi-row INSERT, keeping each statement under _MAX_VARIABLES
+_INSERT_CHUNK_ROWS = _MAX_VARIABLES // len(_EVENT_COLUMNS)
+
+
+@lru_cache(maxsize=None)
+def _upsert_events_sql(row_count: int) -> str:
+    """Build a multi-row upsert for row_count events (cached per row count)"""
+    group = f"({', '.join('?' * len(_EVENT_COLUMNS))})"
+    update_set = ', '.join(f'{col} = excluded.{col}' for col in _EVENT_UPDATE_COLUMNS)
+    # Events are matched on source_url; only those without one fall back to
+    # their id, so a new source_url never merges into another event's row
+    # (multiple ON CONFLICT clauses need SQLite 3.35+)
+    return (
+        f"INSERT INTO events ({', '.join(_EVENT_COLUMNS)}) "
+        f"VALUES {', '.join([group] * row_count)} "
+        f"ON CONFLICT(source_url) DO UPDATE SET {update_set} "
+        f"ON CONFLICT(id) DO UPDATE SET {update_set} WHERE excluded.source_url IS NULL"
+    )
+
+
+@lru_cache(maxsize=None)
+def _events_query(
+    match: bool,
+    rank: bool,
+    date_from: bool,
+    date_to: bool,
+    category: bool,
+    venue_like: bool,
+    is_free: Optional[bool],
+) -> str:
+    """Build the get_events query for one combination of filters (cached per
+    combination, so repeated filter shapes reuse the same SQL string)
+    
+    match joins the FTS index; rank orders by relevance before date, which
+    only search text asks for, so venue-only matches stay in date order.
+    """
+    if match:
+        query = (
+            "SELECT events.* FROM events"
+            " JOIN events_fts ON events_fts.rowid = events.rowid"
+            " WHERE events_fts MATCH ?"
+        )
+    else:
+        query = "SELECT events.* FROM events WHERE 1=1"
+    
+    if date_from:
+        query += " AND events.start_date >= ?"
+    if date_to:
+        query += " AND events.start_date <= ?"
+    if category:
+        query += " AND events.category = ?"
+    if venue_like:
+        query += " AND events.location LIKE ?"
+    if is_free is not None:
+        # Inlined rather than bound so the planner can match the partial
+        # index on free events
+        query += " AND events.is_free = 1" if is_free else " AND events.is_free = 0"
+    
+    if rank:
+        query += " ORDER BY bm25(events_fts), events.start_date ASC LIMIT ? OFFSET ?"
+    else:
+        query += " ORDER BY events.start_date ASC LIMIT ? OFFSET ?"
+    return query
+
+
+def derive_event_id(event_data: Dict[str, Any]) -> str:
+    """
+    Derive a stable event ID from its content
+    
+    Uses the source URL when present, otherwise the source name, title and
+    start date, so re-ingesting the same event always yields the same ID.
+    For events with a source URL this matches the ID BaseScraper.normalize_event
+    generates; its title-only fallback differs.
+    """
+    base = event_data.get('source_url') or (
+        f"{event_data.get('source_name')}|{event_data.get('title')}|{event_data.get('start_date')}"
+    )
+    return f"evt_{hashlib.blake2b(base.encode(), digest_size=6).hexdigest()}"
+
+
+def _event_row_factory(cursor: sqlite3.Cursor, row: tuple) -> Dict[str, Any]:
+    """Row factory building event dicts straight from the fetched tuple,
+    with is_free converted to a bool"""
+    event = {column[0]: value for column, value in zip(cursor.description, row)}
+    event['is_free'] = bool(event['is_free'])
+    return event
+
+
 class EventsDB:
     """Database class for managing events, venues, and scrape statistics"""
     
-    def __init__(self, db_path: str = "real_events.db"):
+    # Database files whose schema was already set up in this process
+    _initialized_paths = set()
+    
+    def __init__(self, db_path: str = "real_events.db", fast_mode: bool = False):
+        """
+        Args:
+            db_path: Path to the SQLite database file
+            fast_mode: Skip fsync on commit (synchronous=OFF). Only use for
+                reloadable loads such as sample data, since a crash can lose
+                the last transactions.
+        """
         self.db_path = db_path
+        self.fast_mode = fast_mode
+        # One long-lived connection per thread, opened lazily by _connect;
+        # every connection is also tracked so close() can release them all
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        # SQLite allows one writer at a time; writers queue here instead of
+        # failing with "database is locked", while WAL readers never wait
+        self._write_lock = threading.Lock()
+        
+        # Skip the schema DDL when another instance already ran it on this file
+        db_file = Path(db_path).resolve()
+        if db_file in self._initialized_paths and db_file.exists():
+            return
         self._init_db()
+        if db_path != ":memory:":
+            self._initialized_paths.add(db_file)
+    
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Return the calling thread's connection, opening it on first use
+        
+        Connections are reused across calls instead of being opened and
+        closed per query; sqlite3 connections must not be shared between
+        threads, so each thread gets its own.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            # check_same_thread is off only so close() can run from any
+            # thread; each connection is still used by a single thread. The
+            # larger statement cache keeps every get_events filter shape
+            # prepared for the connection's lifetime
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=256)
+            # In WAL mode NORMAL only syncs at checkpoints, not on every commit
+            conn.execute("PRAGMA synchronous = OFF" if self.fast_mode else "PRAGMA synchronous = NORMAL")
+            # Per-connection settings: sorts and temp B-trees stay in memory,
+            # a 16 MB page cache, and reads served through a memory map
+            conn.execute("PRAGMA temp_store = MEMORY")
+            conn.execute("PRAGMA cache_size = -16000")
+            conn.execute("PRAGMA mmap_size = 268435456")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+    
+    def close(self):
+        """
+        Close every open connection. The instance reconnects on next use
+        
+        Connections of other threads are closed too, so only call this once
+        no other thread is still querying through this instance (e.g. at
+        shutdown). PRAGMA optimize runs on the calling thread's connection
+        only, the one known to be idle, and only if that thread has one;
+        statistics are per database file, so one run covers every connection.
+        """
+        own_conn = getattr(self._local, "conn", None)
+        if own_conn is not None:
+            own_conn.execute("PRAGMA optimize")
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+            self._local = threading.local()
+        for conn in connections:
+            conn.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
     
     def _init_db(self):
         """Initialize database schema"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
+        # WAL is persistent in the database file, so setting it once is enough;
+        # in-memory databases cannot use it
+        if self.db_path != ":memory:":
+            cursor.execute("PRAGMA journal_mode = WAL")
+        
         # Events table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS events (
@@ -73,90 +270,220 @@ class EventsDB:
         
         # Indexes for performance
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_events_start_date ON events(start_date)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_events_category ON events(category)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_events_is_free ON events(is_free)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_events_location ON events(location)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_events_source_url ON events(source_url)")
+        
+        # Superseded indexes: category is a prefix of idx_events_category_date,
+        # source_url already has the index behind its UNIQUE constraint, and a
+        # two-valued is_free index only ever competes with the date-ordered ones
+        cursor.execute("DROP INDEX IF EXISTS idx_events_category")
+        cursor.execute("DROP INDEX IF EXISTS idx_events_source_url")
+        cursor.execute("DROP INDEX IF EXISTS idx_events_is_free")
+        
+        # Composite indexes matching get_events' filter + ORDER BY start_date,
+        # so the planner can range-scan in date order without a sort step
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_events_category_date ON events(category, start_date)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_events_free_date ON events(start_date) WHERE is_free = 1")
+        
+        # Full-text index for search, kept in sync with events by triggers
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'events_fts'")
+        fts_exists = cursor.fetchone() is not None
+        cursor.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS events_fts USING fts5(
+                title, description, location, category,
+                content='events', content_rowid='rowid',
+                tokenize='unicode61 remove_diacritics 2'
+            )
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS events_fts_ai AFTER INSERT ON events BEGIN
+                INSERT INTO events_fts(rowid, title, description, location, category)
+                VALUES (new.rowid, new.title, new.description, new.location, new.category);
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS events_fts_ad AFTER DELETE ON events BEGIN
+                INSERT INTO events_fts(events_fts, rowid, title, description, location, category)
+                VALUES ('delete', old.rowid, old.title, old.description, old.location, old.category);
+            END
+        """)
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS events_fts_au AFTER UPDATE ON events BEGIN
+                INSERT INTO events_fts(events_fts, rowid, title, description, location, category)
+                VALUES ('delete', old.rowid, old.title, old.description, old.location, old.category);
+                INSERT INTO events_fts(rowid, title, description, location, category)
+                VALUES (new.rowid, new.title, new.description, new.location, new.category);
+            END
+        """)
+        if not fts_exists:
+            # Index events stored before the full-text table existed
+            cursor.execute("INSERT INTO events_fts(events_fts) VALUES ('rebuild')")
+        
+        # Gather planner statistics once there is data to describe; close(),
+        # called at API shutdown and by the scripts, keeps them fresh
+        # afterwards with PRAGMA optimize
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE name = 'sqlite_stat1'")
+        has_stats = cursor.fetchone() is not None
+        cursor.execute("SELECT 1 FROM events LIMIT 1")
+        if not has_stats and cursor.fetchone() is not None:
+            cursor.execute("ANALYZE")
         
         conn.commit()
-        conn.close()
     
     def add_event(self, event_data: Dict[str, Any]) -> bool:
         """Add or update an event. Returns True if added, False if updated"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
-        # Check if event exists by source_url
-        existing = None
-        if event_data.get('source_url'):
-            cursor.execute("SELECT id FROM events WHERE source_url = ?", (event_data['source_url'],))
-            existing = cursor.fetchone()
-        
-        event_id = event_data.get('id') or (existing[0] if existing else f"evt_{datetime.now().timestamp()}")
-        
-        # Prepare data
+        # One statement instead of an existence probe plus the upsert: an
+        # update keeps the stored created_at, so the row was inserted exactly
+        # when the returned created_at is the timestamp passed in
         now = datetime.now().isoformat()
-        is_new = existing is None
-        
-        if is_new:
-            cursor.execute("""
-                INSERT INTO events (
-                    id, title, description, start_date, end_date, location, address,
-                    category, image_url, source_url, source_name,
-                    is_free, price, price_min, price_max, currency, ticket_url,
-                    created_at, updated_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                event_id,
-                event_data.get('title'),
-                event_data.get('description'),
-                event_data.get('start_date'),
-                event_data.get('end_date'),
-                event_data.get('location'),
-                event_data.get('address'),
-                event_data.get('category'),
-                event_data.get('image_url'),
-                event_data.get('source_url'),
-                event_data.get('source_name'),
-                1 if event_data.get('is_free') else 0,
-                event_data.get('price'),
-                event_data.get('price_min'),
-                event_data.get('price_max'),
-                event_data.get('currency', 'EUR'),
-                event_data.get('ticket_url'),
-                now,
-                now
-            ))
-        else:
-            cursor.execute("""
-                UPDATE events SET
-                    title = ?, description = ?, start_date = ?, end_date = ?,
-                    location = ?, address = ?, category = ?, image_url = ?,
-                    is_free = ?, price = ?, price_min = ?, price_max = ?,
-                    currency = ?, ticket_url = ?, updated_at = ?
-                WHERE id = ?
-            """, (
-                event_data.get('title'),
-                event_data.get('description'),
-                event_data.get('start_date'),
-                event_data.get('end_date'),
-                event_data.get('location'),
-                event_data.get('address'),
-                event_data.get('category'),
-                event_data.get('image_url'),
-                1 if event_data.get('is_free') else 0,
-                event_data.get('price'),
-                event_data.get('price_min'),
-                event_data.get('price_max'),
-                event_data.get('currency', 'EUR'),
-                event_data.get('ticket_url'),
-                now,
-                event_id
-            ))
+        params = self._event_params(event_data, event_data.get('id') or derive_event_id(event_data), now)
+        
+        with self._write_lock:
+            try:
+                cursor.execute(_upsert_events_sql(1) + " RETURNING created_at", params)
+                row = cursor.fetchone()
+                if row is None:
+                    # The id fallback skipped the update: the ID belongs to
+                    # another event and this one has its own source_url
+                    raise sqlite3.IntegrityError(f"UNIQUE constraint failed: events.id ({params[0]})")
+                created_at = row[0]
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+        
+        return created_at == now
+    
+    def add_events(self, events: List[Dict[str, Any]]) -> Tuple[int, int]:
+        """
+        Add or update a batch of events in a single transaction
+        
+        Args:
+            events: List of event dictionaries matching the database schema
+        
+        Returns:
+            Tuple of (added_count, updated_count)
+        """
+        added = self.add_events_with_status(events)
+        added_count = sum(added)
+        return added_count, len(added) - added_count
+    
+    def add_events_with_status(self, events: List[Dict[str, Any]]) -> List[bool]:
+        """
+        Add or update a batch of events in a single transaction, reporting
+        which of them were inserted
+        
+        Rows are written with INSERT ... ON CONFLICT DO UPDATE, so new and
+        existing events go through the same statement; events are matched
+        on source_url, or on their ID when they have none. Stored keys are
+        looked up once up front to count them and to reject new events whose
+        ID is already taken.
+        
+        Args:
+            events: List of event dictionaries matching the database schema
+        
+        Returns:
+            One flag per event, in order: True if it was added, False if it
+            updated a stored event (or an earlier duplicate in the batch)
+        
+        Raises:
+            sqlite3.IntegrityError: An event with a new source_url carries
+                the ID of another event; nothing from the batch is written
+        """
+        conn = self._connect()
+        cursor = conn.cursor()
         
-        conn.commit()
-        conn.close()
-        return is_new
+        with self._write_lock:
+            try:
+                # Take SQLite's write lock before the key lookups so no other
+                # connection can insert between the checks and the upsert
+                conn.execute("BEGIN IMMEDIATE")
+                event_ids = [e.get('id') or derive_event_id(e) for e in events]
+                existing_urls = self._existing_values(
+                    cursor, 'source_url', [e['source_url'] for e in events if e.get('source_url')]
+                )
+                existing_ids = self._existing_values(cursor, 'id', event_ids)
+                
+                now = datetime.now().isoformat()
+                rows = []
+                added = []
+                
+                for event_data, event_id in zip(events, event_ids):
+                    source_url = event_data.get('source_url')
+                    if source_url:
+                        if source_url not in existing_urls:
+                            # A new source_url is inserted as a new row, so its
+                            # ID must not already belong to another event
+                            if event_id in existing_ids:
+                                raise sqlite3.IntegrityError(f"UNIQUE constraint failed: events.id ({event_id})")
+                            is_new = True
+                            # Later duplicates of this event in the batch are updates
+                            existing_urls.add(source_url)
+                            existing_ids.add(event_id)
+                        else:
+                            is_new = False
+                    else:
+                        is_new = event_id not in existing_ids
+                        existing_ids.add(event_id)
+                    
+                    added.append(is_new)
+                    rows.append(self._event_params(event_data, event_id, now))
+                
+                # Multi-row VALUES statements bind and step once per chunk
+                # instead of once per event
+                for i in range(0, len(rows), _INSERT_CHUNK_ROWS):
+                    chunk = rows[i:i + _INSERT_CHUNK_ROWS]
+                    cursor.execute(
+                        _upsert_events_sql(len(chunk)),
+                        [value for row in chunk for value in row]
+                    )
+                
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+        
+        return added
+    
+    def _existing_values(self, cursor: sqlite3.Cursor, column: str, values: List[str]) -> set:
+        """Return the subset of values already stored in the given events column"""
+        if not values:
+            return set()
+        # The values travel as one JSON array parameter, so the SQL text is
+        # the same for every batch size and stays in the statement cache
+        cursor.execute(
+            f"SELECT {column} FROM events WHERE {column} IN (SELECT value FROM json_each(?))",
+            (json.dumps(values),)
+        )
+        return {row[0] for row in cursor.fetchall()}
+    
+    @staticmethod
+    def _event_params(event_data: Dict[str, Any], event_id: str, now: str) -> tuple:
+        """Build the upsert parameters for an event, in _EVENT_COLUMNS order"""
+        return (
+            event_id,
+            event_data.get('title'),
+            event_data.get('description'),
+            event_data.get('start_date'),
+            event_data.get('end_date'),
+            event_data.get('location'),
+            event_data.get('address'),
+            event_data.get('category'),
+            event_data.get('image_url'),
+            # Empty URLs are stored as NULL so they take the id fallback
+            event_data.get('source_url') or None,
+            event_data.get('source_name'),
+            1 if event_data.get('is_free') else 0,
+            event_data.get('price'),
+            event_data.get('price_min'),
+            event_data.get('price_max'),
+            event_data.get('currency', 'EUR'),
+            event_data.get('ticket_url'),
+            now,
+            now
+        )
     
     def get_events(
         self,
@@ -165,99 +492,128 @@ class EventsDB:
         category: Optional[str] = None,
         venue: Optional[str] = None,
         is_free: Optional[bool] = None,
+        search: Optional[str] = None,
         limit: int = 100,
         offset: int = 0
     ) -> List[Dict[str, Any]]:
-        """Get events with filters"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        query = "SELECT * FROM events WHERE 1=1"
-        params = []
-        
-        if date_from:
-            query += " AND start_date >= ?"
-            params.append(date_from)
-        
-        if date_to:
-            query += " AND start_date <= ?"
-            params.append(date_to)
-        
-        if category:
-            query += " AND category = ?"
-            params.append(category)
-        
-        if venue:
-            query += " AND location LIKE ?"
+        """
+        Get events with filters and optional text search
+        
+        Results are in start date order, or by relevance first when search
+        is given. Each venue word must be the prefix of a word in the
+        location: "mus louv" matches "Musée du Louvre", while a fragment
+        from inside a word such as "ée" does not.
+        """
+        return list(self.iter_events(
+            date_from=date_from,
+            date_to=date_to,
+            category=category,
+            venue=venue,
+            is_free=is_free,
+            search=search,
+            limit=limit,
+            offset=offset
+        ))
+    
+    def iter_events(
+        self,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        category: Optional[str] = None,
+        venue: Optional[str] = None,
+        is_free: Optional[bool] = None,
+        search: Optional[str] = None,
+        limit: int = 100,
+        offset: int = 0,
+        batch_size: int = 256
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield events matching the same filters as get_events, fetching
+        rows in batches instead of materializing the whole result"""
+        cursor = self._connect().cursor()
+        cursor.row_factory = _event_row_factory
+        
+        # Every search word must prefix-match a token in title, description,
+        # location or category, and every venue word a token in location;
+        # words are quoted so FTS5 operators in user input are plain text
+        search_words = search.split() if search else []
+        venue_words = venue.split() if venue else []
+        match_terms = [self._fts_prefix(word) for word in search_words]
+        if venue_words:
+            venue_terms = " ".join(self._fts_prefix(word) for word in venue_words)
+            match_terms.append(f"location : ({venue_terms})")
+        
+        venue_like = bool(venue) and not venue_words
+        
+        # Parameters are bound in the order _events_query adds the clauses
+        params = [" AND ".join(match_terms)] if match_terms else []
+        for value in (date_from, date_to, category):
+            if value:
+                params.append(value)
+        if venue_like:
             params.append(f"%{venue}%")
-        
-        if is_free is not None:
-            query += " AND is_free = ?"
-            params.append(1 if is_free else 0)
-        
-        query += " ORDER BY start_date ASC LIMIT ? OFFSET ?"
         params.extend([limit, offset])
         
+        query = _events_query(
+            bool(match_terms), bool(search_words),
+            bool(date_from), bool(date_to), bool(category), venue_like, is_free
+        )
         cursor.execute(query, params)
-        rows = cursor.fetchall()
         
-        events = []
-        for row in rows:
-            event = dict(row)
-            event['is_free'] = bool(event['is_free'])
-            events.append(event)
-        
-        conn.close()
-        return events
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            yield from rows
+    
+    @staticmethod
+    def _fts_prefix(word: str) -> str:
+        """Quote a word as an FTS5 prefix query term"""
+        return '"' + word.replace('"', '""') + '"*'
     
     def get_event(self, event_id: str) -> Optional[Dict[str, Any]]:
         """Get a single event by ID"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        cursor = self._connect().cursor()
+        cursor.row_factory = _event_row_factory
         
         cursor.execute("SELECT * FROM events WHERE id = ?", (event_id,))
-        row = cursor.fetchone()
-        
-        if row:
-            event = dict(row)
-            event['is_free'] = bool(event['is_free'])
-            conn.close()
-            return event
-        
-        conn.close()
-        return None
+        return cursor.fetchone()
+    
+    def get_events_by_ids(self, event_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get several events by ID in one query. Returns a dict keyed by ID"""
+        cursor = self._connect().cursor()
+        cursor.row_factory = _event_row_factory
+        
+        # One JSON array parameter instead of a placeholder per ID, so any
+        # number of IDs shares a single cached statement
+        cursor.execute(
+            "SELECT * FROM events WHERE id IN (SELECT value FROM json_each(?))",
+            (json.dumps(event_ids),)
+        )
+        return {event['id']: event for event in cursor.fetchall()}
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get database statistics"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Total events
-        cursor.execute("SELECT COUNT(*) FROM events")
-        total_events = cursor.fetchone()[0]
-        
-        # Free events
-        cursor.execute("SELECT COUNT(*) FROM events WHERE is_free = 1")
-        free_events = cursor.fetchone()[0]
-        
-        # Events with ticket URL
-        cursor.execute("SELECT COUNT(*) FROM events WHERE ticket_url IS NOT NULL AND ticket_url != ''")
-        with_ticket_url = cursor.fetchone()[0]
+        cursor = self._connect().cursor()
         
-        # Upcoming events (next 30 days)
-        from datetime import datetime, timedelta
-        future_date = (datetime.now() + timedelta(days=30)).isoformat()
-        cursor.execute("SELECT COUNT(*) FROM events WHERE start_date >= datetime('now') AND start_date <= ?", (future_date,))
-        upcoming_30_days = cursor.fetchone()[0]
+        # Totals, free events, events with ticket URL and upcoming events
+        # (next 30 days) in a single scan
+        # Both bounds are ISO strings computed once in Python, matching the
+        # format start_date is stored in so the comparison stays textual
+        now = datetime.now()
+        cursor.execute("""
+            SELECT
+                COUNT(*),
+                COALESCE(SUM(is_free = 1), 0),
+                COALESCE(SUM(ticket_url IS NOT NULL AND ticket_url != ''), 0),
+                COALESCE(SUM(start_date >= ? AND start_date <= ?), 0)
+            FROM events
+        """, (now.isoformat(), (now + timedelta(days=30)).isoformat()))
+        total_events, free_events, with_ticket_url, upcoming_30_days = cursor.fetchone()
         
         # By category
         cursor.execute("SELECT category, COUNT(*) FROM events WHERE category IS NOT NULL GROUP BY category")
         by_category = {row[0]: row[1] for row in cursor.fetchall()}
         
-        conn.close()
-        
         return {
             "total_events": total_events,
             "free_events": free_events,
@@ -268,23 +624,19 @@ class EventsDB:
     
     def get_categories(self) -> List[str]:
         """Get list of all categories"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._connect().cursor()
         
         cursor.execute("SELECT DISTINCT category FROM events WHERE category IS NOT NULL ORDER BY category")
         categories = [row[0] for row in cursor.fetchall()]
         
-        conn.close()
         return categories
     
     def get_venues(self) -> List[str]:
         """Get list of all venues"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
+        cursor = self._connect().cursor()
         
         cursor.execute("SELECT DISTINCT location FROM events WHERE location IS NOT NULL ORDER BY location")
         venues = [row[0] for row in cursor.fetchall()]
         
-        conn.close()
         return venues
 
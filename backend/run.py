@@ -1,5 +1,8 @@
 """
 Run script for Artify API server
+
+Set API_RELOAD=1 for the auto-reloading development server; otherwise the
+app is served by API_WORKERS worker processes.
 """
 import uvicorn
 import os
@@ -7,5 +10,7 @@ import os
 if __name__ == "__main__":
     host = os.getenv("API_HOST", "0.0.0.0")
     port = int(os.getenv("API_PORT", "8000"))
-    uvicorn.run("api.main:app", host=host, port=port, reload=True)
-
+    reload = os.getenv("API_RELOAD", "0") == "1"
+    # uvicorn cannot combine the reloader with multiple workers
+    workers = 1 if reload else int(os.getenv("API_WORKERS", "2"))
+    uvicorn.run("api.main:app", host=host, port=port, reload=reload, workers=workers)
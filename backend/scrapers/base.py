@@ -4,6 +4,7 @@ Base scraper class for Playwright-based web scraping
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any, Optional
 from playwright.sync_api import sync_playwright, Browser, Page, TimeoutError as PlaywrightTimeoutError
+import hashlib
 import time
 import logging
 
@@ -170,9 +171,8 @@ class BaseScraper(ABC):
         
         # Generate ID if not provided
         if "id" not in event_data:
-            import hashlib
             source = normalized.get("source_url") or normalized.get("title", "")
-            normalized["id"] = f"evt_{hashlib.md5(source.encode()).hexdigest()[:12]}"
+            normalized["id"] = f"evt_{hashlib.blake2b(source.encode(), digest_size=6).hexdigest()}"
         else:
             normalized["id"] = event_data["id"]
         
@@ -1,18 +1,22 @@
 """
 Script to add sample events to the database for testing
 """
+import argparse
 import sys
 from pathlib import Path
 from datetime import datetime, timedelta
+from typing import Optional
 
 # Add backend to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from core.db import EventsDB
 
-def add_sample_events():
+def add_sample_events(db: Optional[EventsDB] = None, verbose: bool = False):
     """Add sample Paris cultural events to the database"""
-    db = EventsDB()
+    if db is None:
+        db = EventsDB()
+    now = datetime.now()
     
     # Sample events
     events = [
@@ -20,8 +24,8 @@ def add_sample_events():
             "id": "evt_louvre_van_gogh",
             "title": "Van Gogh : Les Nuits Étoilées",
             "description": "Une exposition exceptionnelle présentant les plus belles œuvres de Vincent van Gogh, avec un focus sur ses célèbres nuits étoilées. Découvrez l'évolution de son style et son influence sur l'art moderne.",
-            "start_date": (datetime.now() + timedelta(days=5)).isoformat(),
-            "end_date": (datetime.now() + timedelta(days=95)).isoformat(),
+            "start_date": (now + timedelta(days=5)).isoformat(),
+            "end_date": (now + timedelta(days=95)).isoformat(),
             "location": "Musée du Louvre",
             "address": "Rue de Rivoli, 75001 Paris",
             "category": "art",
@@ -37,8 +41,8 @@ def add_sample_events():
             "id": "evt_orsay_impressionnistes",
             "title": "Les Impressionnistes en Plein Air",
             "description": "Exposition temporaire sur les peintres impressionnistes et leur relation avec la nature. Plus de 80 œuvres de Monet, Renoir, Pissarro et bien d'autres.",
-            "start_date": (datetime.now() + timedelta(days=2)).isoformat(),
-            "end_date": (datetime.now() + timedelta(days=60)).isoformat(),
+            "start_date": (now + timedelta(days=2)).isoformat(),
+            "end_date": (now + timedelta(days=60)).isoformat(),
             "location": "Musée d'Orsay",
             "address": "1 Rue de la Légion d'Honneur, 75007 Paris",
             "category": "art",
@@ -54,8 +58,8 @@ def add_sample_events():
             "id": "evt_pompidou_contemporain",
             "title": "Art Contemporain : Nouvelles Perspectives",
             "description": "Découvrez les dernières tendances de l'art contemporain avec des œuvres d'artistes émergents et établis. Installation interactive, vidéo-art et performances.",
-            "start_date": (datetime.now() + timedelta(days=1)).isoformat(),
-            "end_date": (datetime.now() + timedelta(days=45)).isoformat(),
+            "start_date": (now + timedelta(days=1)).isoformat(),
+            "end_date": (now + timedelta(days=45)).isoformat(),
             "location": "Centre Pompidou",
             "address": "Place Georges-Pompidou, 75004 Paris",
             "category": "art",
@@ -72,8 +76,8 @@ def add_sample_events():
             "id": "evt_philharmonie_jazz",
             "title": "Jazz Night : Herbie Hancock Tribute",
             "description": "Concert exceptionnel en hommage à Herbie Hancock avec des musiciens de renommée internationale. Une soirée inoubliable de jazz moderne.",
-            "start_date": (datetime.now() + timedelta(days=7, hours=20)).isoformat(),
-            "end_date": (datetime.now() + timedelta(days=7, hours=23)).isoformat(),
+            "start_date": (now + timedelta(days=7, hours=20)).isoformat(),
+            "end_date": (now + timedelta(days=7, hours=23)).isoformat(),
             "location": "Philharmonie de Paris",
             "address": "221 Avenue Jean Jaurès, 75019 Paris",
             "category": "music",
@@ -90,8 +94,8 @@ def add_sample_events():
             "id": "evt_opera_carmen",
             "title": "Carmen - Opéra de Bizet",
             "description": "Représentation de l'opéra emblématique de Georges Bizet dans une mise en scène moderne et audacieuse. Distribution internationale de premier plan.",
-            "start_date": (datetime.now() + timedelta(days=10, hours=19)).isoformat(),
-            "end_date": (datetime.now() + timedelta(days=10, hours=22)).isoformat(),
+            "start_date": (now + timedelta(days=10, hours=19)).isoformat(),
+            "end_date": (now + timedelta(days=10, hours=22)).isoformat(),
             "location": "Opéra Bastille",
             "address": "Place de la Bastille, 75012 Paris",
             "category": "theater",
@@ -108,8 +112,8 @@ def add_sample_events():
             "id": "evt_grand_palais_photo",
             "title": "Photographie Contemporaine : Regards sur Paris",
             "description": "Exposition gratuite présentant les meilleurs photographes contemporains et leur vision de Paris. Entrée libre tous les premiers dimanches du mois.",
-            "start_date": (datetime.now() + timedelta(days=3)).isoformat(),
-            "end_date": (datetime.now() + timedelta(days=30)).isoformat(),
+            "start_date": (now + timedelta(days=3)).isoformat(),
+            "end_date": (now + timedelta(days=30)).isoformat(),
             "location": "Grand Palais",
             "address": "3 Avenue du Général Eisenhower, 75008 Paris",
             "category": "art",
@@ -125,8 +129,8 @@ def add_sample_events():
             "id": "evt_cite_musique_workshop",
             "title": "Atelier de Musique Électronique",
             "description": "Atelier interactif pour découvrir la création musicale électronique. Ouvert à tous les niveaux. Matériel fourni.",
-            "start_date": (datetime.now() + timedelta(days=6, hours=14)).isoformat(),
-            "end_date": (datetime.now() + timedelta(days=6, hours=17)).isoformat(),
+            "start_date": (now + timedelta(days=6, hours=14)).isoformat(),
+            "end_date": (now + timedelta(days=6, hours=17)).isoformat(),
             "location": "Cité de la Musique",
             "address": "221 Avenue Jean Jaurès, 75019 Paris",
             "category": "music",
@@ -142,8 +146,8 @@ def add_sample_events():
             "id": "evt_palais_tokyo_installation",
             "title": "Installation Interactive : Espace-Temps",
             "description": "Une installation artistique immersive qui explore les concepts d'espace et de temps à travers des technologies numériques et des expériences sensorielles.",
-            "start_date": (datetime.now() + timedelta(days=4)).isoformat(),
-            "end_date": (datetime.now() + timedelta(days=50)).isoformat(),
+            "start_date": (now + timedelta(days=4)).isoformat(),
+            "end_date": (now + timedelta(days=50)).isoformat(),
             "location": "Palais de Tokyo",
             "address": "13 Avenue du Président Wilson, 75016 Paris",
             "category": "art",
@@ -159,8 +163,8 @@ def add_sample_events():
             "id": "evt_theatre_ville_dance",
             "title": "Spectacle de Danse Contemporaine",
             "description": "Compagnie de danse internationale présente une création originale mêlant danse contemporaine et musique live. Performance captivante et émotionnelle.",
-            "start_date": (datetime.now() + timedelta(days=8, hours=20)).isoformat(),
-            "end_date": (datetime.now() + timedelta(days=8, hours=21, minutes=30)).isoformat(),
+            "start_date": (now + timedelta(days=8, hours=20)).isoformat(),
+            "end_date": (now + timedelta(days=8, hours=21, minutes=30)).isoformat(),
             "location": "Théâtre de la Ville",
             "address": "2 Place du Châtelet, 75001 Paris",
             "category": "dance",
@@ -177,8 +181,8 @@ def add_sample_events():
             "id": "evt_cinematheque_film",
             "title": "Rétrospective : Cinéma Français des Années 60",
             "description": "Cycle de projections de films français emblématiques des années 1960. Présentation et discussion avec des cinéastes et critiques.",
-            "start_date": (datetime.now() + timedelta(days=12, hours=19)).isoformat(),
-            "end_date": (datetime.now() + timedelta(days=12, hours=21, minutes=30)).isoformat(),
+            "start_date": (now + timedelta(days=12, hours=19)).isoformat(),
+            "end_date": (now + timedelta(days=12, hours=21, minutes=30)).isoformat(),
             "location": "Cinémathèque Française",
             "address": "51 Rue de Bercy, 75012 Paris",
             "category": "film",
@@ -192,19 +196,16 @@ def add_sample_events():
         },
     ]
     
-    added_count = 0
-    updated_count = 0
+    added = db.add_events_with_status(events)
+    added_titles = [event['title'] for event, is_new in zip(events, added) if is_new]
+    updated_titles = [event['title'] for event, is_new in zip(events, added) if not is_new]
     
-    for event in events:
-        is_new = db.add_event(event)
-        if is_new:
-            added_count += 1
-            print(f"✅ Ajouté: {event['title']}")
-        else:
-            updated_count += 1
-            print(f"🔄 Mis à jour: {event['title']}")
+    if verbose:
+        lines = [f"✅ Ajouté: {title}" for title in added_titles]
+        lines += [f"🔄 Mis à jour: {title}" for title in updated_titles]
+        print("\n".join(lines))
     
-    print(f"\n📊 Résumé: {added_count} événements ajoutés, {updated_count} mis à jour")
+    print(f"\n📊 Résumé: {len(added_titles)} événements ajoutés, {len(updated_titles)} mis à jour")
     
     # Afficher les statistiques
     stats = db.get_statistics()
@@ -215,5 +216,14 @@ def add_sample_events():
     print(f"   Par catégorie: {stats['by_category']}")
 
 if __name__ == "__main__":
-    add_sample_events()
+    parser = argparse.ArgumentParser(description="Add sample events to the Artify database")
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="List which sample events were added and which were updated"
+    )
+    args = parser.parse_args()
+    # Sample data can simply be reloaded, so skip fsync on commit
+    with EventsDB(fast_mode=True) as db:
+        add_sample_events(db, verbose=args.verbose)
 